@@ -7,93 +7,154 @@ Engineer-to-Order (ETO) manufacturing environment specialized for food packaging
 import os
 import json
 import datetime
+import logging
+import tempfile
+from functools import lru_cache
+from types import SimpleNamespace
 import pandas as pd
 import numpy as np
-import plotly.express as px
+from plotly.colors import qualitative, sequential
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, dash_table, Input, Output, callback
 import dash_bootstrap_components as dbc
-from models import Session, Project, Resource, InventoryItem, KpiRecord, create_tables, initialize_sample_data
+from sqlalchemy import func, select
 
-# Create database tables and initialize with sample data if needed
-create_tables()
-initialize_sample_data()
+try:
+    import pyarrow
+    pyarrow_available = True
+except ImportError:
+    pyarrow_available = False
+
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+try:
+    from flask_compress import Compress
+    compress_available = True
+except ImportError:
+    compress_available = False
+
+# Keep compiled numba kernels across worker restarts
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.expanduser("~/.numba_cache"))
+try:
+    from numba import njit
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+from models import engine, Project, Resource, InventoryItem, KpiRecord, create_tables, initialize_sample_data
+
+logger = logging.getLogger(__name__)
+
+# Column dtypes for the dashboard DataFrames read from the database: categorical
+# codes for repeated labels, int16 for small bounded counts, 32-bit for the rest;
+# nullable Int16/Int32 wherever the model column is Optional. KPI percentages stay
+# float64 so cards and hover labels show the stored values (87.3, not 87.30000305)
+PROJECT_COLUMNS = {
+    "id": "int32",
+    "name": "object",
+    "type": "category",
+    "customer": "category",
+    "start_date": "datetime64[ns]",
+    "due_date": "datetime64[ns]",
+    "status": "category",
+    "progress": "Int16",
+    "estimated_hours": "Int32",
+    "actual_hours": "Int32",
+    "cost_variance": "float32",
+    "schedule_variance": "float32",
+    "materials_cost": "float32",
+    "labor_cost": "float32",
+    "original_budget": "float32",
+    "current_budget": "float32"
+}
+
+RESOURCE_COLUMNS = {
+    "id": "int32",
+    "name": "object",
+    "type": "category",
+    "department": "category",
+    "utilization": "float32",
+    "available_hours": "Int16",
+    "scheduled_hours": "Int16",
+    "project_count": "Int16"
+}
+
+INVENTORY_COLUMNS = {
+    "component": "category",
+    "on_hand": "Int32",
+    "allocated": "Int32",
+    "on_order": "Int32",
+    "lead_time_days": "Int16",
+    "reorder_point": "Int16",
+    "avg_monthly_usage": "float32",
+    "cost_per_unit": "float32"
+}
+
+KPI_COLUMNS = {
+    "date": "datetime64[ns]",
+    "on_time_delivery": "float64",
+    "first_pass_yield": "float64",
+    "labor_efficiency": "float64",
+    "cycle_time_variance": "float64",
+    "material_waste_percent": "float64",
+    "engineering_change_orders": "Int16",
+    "customer_satisfaction": "float64",
+    "safety_incidents": "Int16"
+}
+
+def _arrow_dtype(dtype):
+    """Arrow-backed pandas dtype equivalent to a NumPy dtype name"""
+    if dtype == "object":
+        return pd.ArrowDtype(pyarrow.string())
+    # Nullable "Int16"/"Int32" map to the same Arrow integer type, which carries its own nulls
+    return pd.ArrowDtype(pyarrow.from_numpy_dtype(np.dtype(dtype.lower())))
+
+# Rows fetched per round trip when streaming tables out of the database
+READ_CHUNK_SIZE = 1000
+
+def _read_frame(connection, model, columns, order_by=None):
+    """Read a model's table into a DataFrame with explicit dtypes, bypassing ORM objects"""
+    query = select(*(model.__table__.c[name] for name in columns))
+    if order_by is not None:
+        query = query.order_by(order_by)
+    chunks = pd.read_sql_query(query, connection, chunksize=READ_CHUNK_SIZE)
+    # Narrow numeric columns chunk by chunk; categoricals are encoded once after the concat,
+    # since chunks with different label sets would concatenate back to plain strings
+    categories = {name: dtype for name, dtype in columns.items() if dtype == "category"}
+    others = {name: dtype for name, dtype in columns.items() if dtype != "category"}
+    frame = pd.concat([chunk.astype(others) for chunk in chunks], ignore_index=True).astype(categories)
+    if pyarrow_available:
+        # Arrow-backed columns; categorical columns keep their integer codes
+        frame = frame.astype({
+            name: _arrow_dtype(dtype) for name, dtype in columns.items() if dtype != "category"
+        })
+    return frame
 
 # Function to get data from the database
 def get_data_from_db():
-    session = Session()
-    
-    # Get projects
-    projects_db = session.query(Project).all()
-    projects = []
-    for project in projects_db:
-        projects.append({
-            "id": project.id,
-            "name": project.name,
-            "type": project.type,
-            "customer": project.customer,
-            "start_date": project.start_date.strftime("%Y-%m-%d") if project.start_date else "",
-            "due_date": project.due_date.strftime("%Y-%m-%d") if project.due_date else "",
-            "status": project.status,
-            "progress": project.progress,
-            "estimated_hours": project.estimated_hours,
-            "actual_hours": project.actual_hours,
-            "cost_variance": project.cost_variance,
-            "schedule_variance": project.schedule_variance,
-            "materials_cost": project.materials_cost,
-            "labor_cost": project.labor_cost,
-            "original_budget": project.original_budget,
-            "current_budget": project.current_budget
-        })
-    
-    # Get resources
-    resources_db = session.query(Resource).all()
-    resources = []
-    for resource in resources_db:
-        resources.append({
-            "id": resource.id,
-            "name": resource.name,
-            "type": resource.type,
-            "department": resource.department,
-            "utilization": resource.utilization,
-            "available_hours": resource.available_hours,
-            "scheduled_hours": resource.scheduled_hours,
-            "project_count": resource.project_count
-        })
-    
-    # Get inventory
-    inventory_db = session.query(InventoryItem).all()
-    inventory = []
-    for item in inventory_db:
-        inventory.append({
-            "component": item.component,
-            "on_hand": item.on_hand,
-            "allocated": item.allocated,
-            "on_order": item.on_order,
-            "lead_time_days": item.lead_time_days,
-            "reorder_point": item.reorder_point,
-            "avg_monthly_usage": item.avg_monthly_usage,
-            "cost_per_unit": item.cost_per_unit
-        })
+    with engine.connect() as connection:
+        # Server-side cursor where the driver supports one, so rows arrive in bounded batches
+        connection = connection.execution_options(stream_results=True, yield_per=READ_CHUNK_SIZE)
+        projects = _read_frame(connection, Project, PROJECT_COLUMNS)
+        resources = _read_frame(connection, Resource, RESOURCE_COLUMNS)
+        inventory = _read_frame(connection, InventoryItem, INVENTORY_COLUMNS)
+        kpis = _read_frame(connection, KpiRecord, KPI_COLUMNS, order_by=KpiRecord.date)
     
-    # Get KPIs
-    kpis_db = session.query(KpiRecord).order_by(KpiRecord.date).all()
-    kpis = []
-    for kpi in kpis_db:
-        kpis.append({
-            "date": kpi.date.strftime("%Y-%m"),
-            "on_time_delivery": kpi.on_time_delivery,
-            "first_pass_yield": kpi.first_pass_yield,
-            "labor_efficiency": kpi.labor_efficiency,
-            "cycle_time_variance": kpi.cycle_time_variance,
-            "material_waste_percent": kpi.material_waste_percent,
-            "engineering_change_orders": kpi.engineering_change_orders,
-            "customer_satisfaction": kpi.customer_satisfaction,
-            "safety_incidents": kpi.safety_incidents
-        })
+    # Format dates once per column
+    projects["start_date"] = projects["start_date"].dt.strftime("%Y-%m-%d")
+    projects["due_date"] = projects["due_date"].dt.strftime("%Y-%m-%d")
+    kpis["date"] = kpis["date"].astype("datetime64[ns]").dt.to_period("M")
     
-    session.close()
+    inventory["inventory_value"] = (
+        inventory["on_hand"].to_numpy(np.float64) * inventory["cost_per_unit"].to_numpy(np.float64)
+    )
     
     return {
         "projects": projects,
@@ -102,441 +163,749 @@ def get_data_from_db():
         "kpis": kpis
     }
 
-# Initialize data from database
-data = get_data_from_db()
+# Parquet snapshots of the dashboard DataFrames, reused while newer than the last database write
+CACHE_DIR = os.environ.get("DASHBOARD_CACHE_DIR", "cache")
+SNAPSHOT_TABLES = {
+    "projects": Project,
+    "resources": Resource,
+    "inventory": InventoryItem,
+    "kpis": KpiRecord
+}
+# Prebuilt figure JSON, valid as long as it is newer than both the snapshot it was built
+# from and this module (which holds the figure builders); kept per plotly version
+FIGURE_CACHE_DIR = os.path.join(CACHE_DIR, "figures", plotly.__version__)
+
+def _snapshot_path(name):
+    return os.path.join(CACHE_DIR, f"{name}.parquet")
+
+def last_db_write():
+    """Most recent updated_at timestamp (naive UTC) across the dashboard tables and
+    each table's row count, so deletes invalidate the snapshot as well as writes"""
+    with engine.connect() as connection:
+        state = {
+            name: connection.execute(select(func.max(model.updated_at), func.count())).one()
+            for name, model in SNAPSHOT_TABLES.items()
+        }
+    timestamps = [ts for ts, _ in state.values() if ts is not None]
+    return max(timestamps, default=None), {name: count for name, (_, count) in state.items()}
+
+def _read_snapshot_table(name):
+    """Read one snapshot file, keeping every column on Arrow memory except categoricals and periods"""
+    frame = pd.read_parquet(_snapshot_path(name))
+    # pandas restores Arrow numerics, categoricals and periods from the file metadata,
+    # but materializes plain strings with its own string dtype
+    return frame.astype({
+        column: pd.ArrowDtype(pyarrow.string())
+        for column, dtype in frame.dtypes.items() if isinstance(dtype, pd.StringDtype)
+    })
+
+def read_snapshot(last_write, row_counts):
+    """Load the Parquet snapshot if every file is newer than last_write and holds
+    as many rows as its table, else None"""
+    if not pyarrow_available:
+        return None
+    
+    try:
+        for name in SNAPSHOT_TABLES:
+            mtime = os.path.getmtime(_snapshot_path(name))
+            written = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc).replace(tzinfo=None)
+            if last_write is not None and written <= last_write:
+                return None
+        data = {name: _read_snapshot_table(name) for name in SNAPSHOT_TABLES}
+    except (OSError, ValueError):
+        # Missing or unreadable files (pyarrow.ArrowInvalid is a ValueError) fall back to the database
+        return None
+    if any(len(data[name]) != row_counts[name] for name in SNAPSHOT_TABLES):
+        return None
+    return data
+
+def _write_atomically(path, write):
+    """Call write(tmp_path) on a temporary file next to path, then move it into place,
+    so readers (other workers included) never see a partially written file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates the file owner-only; workers running as other users read it too
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_snapshot(data):
+    """Persist the dashboard DataFrames as zstd-compressed Parquet files"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for name in SNAPSHOT_TABLES:
+        _write_atomically(_snapshot_path(name), lambda path: data[name].to_parquet(path, compression="zstd"))
+
+@lru_cache(maxsize=None)
+def load_dashboard_data():
+    """Create and seed the database if needed, then load the dashboard DataFrames once"""
+    create_tables()
+    initialize_sample_data()
+    
+    data = read_snapshot(*last_db_write())
+    if data is None:
+        data = get_data_from_db()
+        if pyarrow_available:
+            try:
+                write_snapshot(data)
+            except OSError as e:
+                # The frames are already in memory; a read-only or full cache only costs the next start
+                logger.warning(f"Could not write the dashboard snapshot to {CACHE_DIR}: {e}")
+    return data
+
+# Copy-on-Write avoids defensive copies when deriving columns and subsets
+# (always enabled from pandas 3.0, where the option is deprecated)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+_json_loads = orjson.loads if orjson_available else json.loads
+
+# Dash serializes layouts and callback output through plotly.io's JSON encoder;
+# pin it to orjson, which also encodes NumPy arrays natively
+if orjson_available:
+    pio.json.config.default_engine = "orjson"
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 server = app.server
 
-# Convert to DataFrames for easier manipulation
-projects_df = pd.DataFrame(data["projects"])
-resources_df = pd.DataFrame(data["resources"])
-inventory_df = pd.DataFrame(data["inventory"])
-kpis_df = pd.DataFrame(data["kpis"])
+# Compress HTML, layout JSON and assets on the wire
+if compress_available:
+    server.config["COMPRESS_MIMETYPES"] = [
+        "application/json", "text/html", "text/css", "application/javascript"
+    ]
+    # Prefer Brotli when the client accepts it; skip payloads too small to benefit
+    server.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    server.config["COMPRESS_MIN_SIZE"] = 500
+    Compress(server)
 
 # Define colors
-colors = {
-    "primary": "#0466C8",
-    "secondary": "#979DAC",
-    "success": "#38B000",
-    "warning": "#F48C06",
-    "danger": "#D62828",
-    "light": "#F5F3F4",
-    "dark": "#1B263B",
-    "background": "#F8F9FA",
-    "text": "#212529"
-}
+colors = SimpleNamespace(
+    primary="#0466C8",
+    secondary="#979DAC",
+    success="#38B000",
+    warning="#F48C06",
+    danger="#D62828",
+    light="#F5F3F4",
+    dark="#1B263B",
+    background="#F8F9FA",
+    text="#212529"
+)
+
+# Columns shown in the Projects List table
+PROJECT_LIST_COLUMNS = ["name", "customer", "status", "progress", "due_date"]
+
+def _snapshot_mtime():
+    """Modification time of the newest Parquet snapshot file, or None if any is missing"""
+    try:
+        # Figures combine several tables, so one rewritten file makes every figure stale
+        return max(os.path.getmtime(_snapshot_path(name)) for name in SNAPSHOT_TABLES)
+    except OSError:
+        return None
+
+def _write_text(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+def load_figure(name, build):
+    """Figure JSON for a graph: read from the on-disk bundle if newer than the snapshot
+    and the builder code, else built and stored"""
+    path = os.path.join(FIGURE_CACHE_DIR, f"{name}.json")
+    snapshot_mtime = _snapshot_mtime()
+    if snapshot_mtime is not None:
+        try:
+            if os.path.getmtime(path) > max(snapshot_mtime, os.path.getmtime(__file__)):
+                with open(path, "rb") as f:
+                    return _json_loads(f.read())
+        except (OSError, ValueError):
+            # Unreadable or undecodable files (orjson.JSONDecodeError is a ValueError) are rebuilt
+            pass
+    
+    figure_json = build().to_json()
+    if snapshot_mtime is not None:
+        try:
+            os.makedirs(FIGURE_CACHE_DIR, exist_ok=True)
+            _write_atomically(path, lambda tmp_path: _write_text(tmp_path, figure_json))
+        except OSError as e:
+            logger.warning(f"Could not cache figure {name} in {FIGURE_CACHE_DIR}: {e}")
+    return _json_loads(figure_json)
+
+def static_graph(name, build):
+    """Graph holding plain JSON figure data; build() is only called when no fresh copy is on disk"""
+    return dcc.Graph(figure=load_figure(name, build))
+
+@lru_cache(maxsize=None)
+def kpi_summary():
+    """Compute and format the values shown on the KPI summary cards once"""
+    data = load_dashboard_data()
+    kpis_df = data["kpis"]
+    progress = data["projects"]["progress"].dropna().to_numpy(np.int32)
+    
+    # Single pass over progress: bins 0/1/2 count projects below, at and above 100%
+    in_progress, completed, _ = np.bincount(np.sign(progress - 100) + 1, minlength=3)
+    
+    return {
+        "on_time_delivery": f"{kpis_df['on_time_delivery'].iat[-1]}%",
+        "first_pass_yield": f"{kpis_df['first_pass_yield'].iat[-1]}%",
+        "in_progress": str(in_progress),
+        "completed": f"Completed: {completed}",
+        "utilization": f"{data['resources']['utilization'].mean():.1f}%"
+    }
+
+def build_summary_cards(summary):
+    """Build the KPI summary cards row"""
+    return dbc.Row(
+        [
+            dbc.Col(
+                dbc.Card(
+                    [
+                        dbc.CardBody(
+                            [
+                                html.H4("On-Time Delivery", className="card-title"),
+                                html.H2(summary["on_time_delivery"], 
+                                       className="text-center display-4"),
+                                html.P("Target: 95%", className="card-text text-muted")
+                            ]
+                        )
+                    ],
+                    className="mb-4 text-center"
+                ),
+                width=3
+            ),
+            dbc.Col(
+                dbc.Card(
+                    [
+                        dbc.CardBody(
+                            [
+                                html.H4("First Pass Yield", className="card-title"),
+                                html.H2(summary["first_pass_yield"], 
+                                       className="text-center display-4"),
+                                html.P("Target: 98%", className="card-text text-muted")
+                            ]
+                        )
+                    ],
+                    className="mb-4 text-center"
+                ),
+                width=3
+            ),
+            dbc.Col(
+                dbc.Card(
+                    [
+                        dbc.CardBody(
+                            [
+                                html.H4("Projects In Progress", className="card-title"),
+                                html.H2(summary["in_progress"], 
+                                       className="text-center display-4"),
+                                html.P(summary["completed"], 
+                                      className="card-text text-muted")
+                            ]
+                        )
+                    ],
+                    className="mb-4 text-center"
+                ),
+                width=3
+            ),
+            dbc.Col(
+                dbc.Card(
+                    [
+                        dbc.CardBody(
+                            [
+                                html.H4("Resource Utilization", className="card-title"),
+                                html.H2(summary["utilization"], 
+                                       className="text-center display-4"),
+                                html.P("Target: 85%", className="card-text text-muted")
+                            ]
+                        )
+                    ],
+                    className="mb-4 text-center"
+                ),
+                width=3
+            )
+        ],
+        className="mb-4"
+    )
+
+if numba_available:
+    @njit(cache=True)
+    def _count_codes(codes, n_categories):
+        counts = np.zeros(n_categories, np.int64)
+        for code in codes:
+            if code >= 0:
+                counts[code] += 1
+        return counts
+else:
+    def _count_codes(codes, n_categories):
+        return np.bincount(codes[codes >= 0], minlength=n_categories)
+
+def category_counts(series):
+    """Rows per category of a categorical Series, most frequent first"""
+    categories = series.cat.categories
+    counts = _count_codes(series.cat.codes.to_numpy(), len(categories))
+    return pd.Series(counts, index=categories, name="count").sort_values(ascending=False, kind="stable")
+
+@lru_cache(maxsize=None)
+def dashboard_aggregates():
+    """Group counts and orderings shared by the tab figures, computed once"""
+    data = load_dashboard_data()
+    
+    return {
+        "projects_by_status": category_counts(data["projects"]["status"]),
+        "projects_by_type": category_counts(data["projects"]["type"]),
+        "resources_by_type": category_counts(data["resources"]["type"]),
+        "inventory_by_lead_time": data["inventory"].sort_values(
+            "lead_time_days", ascending=False, kind="stable", ignore_index=True
+        )
+    }
 
-# Dashboard layout
-app.layout = dbc.Container(
-    [
+@lru_cache(maxsize=None)
+def summary_cards():
+    """KPI summary cards row, built once and shared by every page load"""
+    return build_summary_cards(kpi_summary())
+
+def build_projects_tab(data, aggregates):
+    """Build the Project Overview tab content"""
+    projects_df = data["projects"]
+    status_counts = aggregates["projects_by_status"]
+    type_counts = aggregates["projects_by_type"]
+    
+    # Marker arrays for the cost vs schedule scatter, one trace per project type
+    cost_variance = projects_df["cost_variance"].to_numpy(np.float32)
+    schedule_variance = projects_df["schedule_variance"].to_numpy(np.float32)
+    budgets = projects_df["original_budget"].to_numpy(np.float32)
+    budget_sizeref = 2.0 * budgets.max() / 20 ** 2  # plotly express' default size_max=20
+    project_names = projects_df["name"].to_numpy()
+    project_types = projects_df["type"].to_numpy()
+    type_masks = {
+        project_type: project_types == project_type
+        for project_type in projects_df["type"].cat.categories
+    }
+    
+    return [
         dbc.Row(
             [
                 dbc.Col(
-                    html.H1("ETO Manufacturing Dashboard", 
-                            className="text-center my-4",
-                            style={"color": colors["dark"]}),
-                    width=12
+                    [
+                        html.H3("Project Status", className="mt-4"),
+                        static_graph(
+                            "projects_by_status",
+                            lambda: go.Figure(
+                                go.Bar(
+                                    x=status_counts.index.to_numpy(),
+                                    y=status_counts.to_numpy(),
+                                    marker_color=qualitative.G10[:len(status_counts)]
+                                ),
+                                layout=go.Layout(
+                                    title="Projects by Status",
+                                    xaxis_title="Status",
+                                    yaxis_title="Number of Projects"
+                                )
+                            )
+                        )
+                    ],
+                    width=6
+                ),
+                dbc.Col(
+                    [
+                        html.H3("Project Types", className="mt-4"),
+                        static_graph(
+                            "projects_by_type",
+                            lambda: go.Figure(
+                                go.Pie(
+                                    labels=type_counts.index.to_numpy(),
+                                    values=type_counts.to_numpy(),
+                                    marker_colors=qualitative.Plotly
+                                ),
+                                layout=go.Layout(title="Projects by Type")
+                            )
+                        )
+                    ],
+                    width=6
                 )
             ]
         ),
-        
-        # KPI Summary Cards
         dbc.Row(
             [
                 dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
+                    [
+                        html.H3("Project Schedule Performance", className="mt-4"),
+                        static_graph(
+                            "schedule_performance",
+                            lambda: go.Figure(
                                 [
-                                    html.H4("On-Time Delivery", className="card-title"),
-                                    html.H2(f"{kpis_df['on_time_delivery'].iloc[-1]}%", 
-                                           className="text-center display-4"),
-                                    html.P(f"Target: 95%", className="card-text text-muted")
-                                ]
+                                    go.Scattergl(
+                                        x=cost_variance[mask],
+                                        y=schedule_variance[mask],
+                                        mode="markers",
+                                        name=project_type,
+                                        text=project_names[mask],
+                                        marker=dict(size=budgets[mask], sizemode="area", sizeref=budget_sizeref)
+                                    )
+                                    for project_type, mask in type_masks.items()
+                                ],
+                                layout=go.Layout(
+                                    title="Cost vs Schedule Variance",
+                                    xaxis_title="Cost Variance (%)",
+                                    yaxis_title="Schedule Variance (%)",
+                                    legend_title="Type"
+                                )
                             )
-                        ],
-                        className="mb-4 text-center"
-                    ),
-                    width=3
-                ),
+                        )
+                    ],
+                    width=12
+                )
+            ]
+        ),
+        dbc.Row(
+            [
                 dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                [
-                                    html.H4("First Pass Yield", className="card-title"),
-                                    html.H2(f"{kpis_df['first_pass_yield'].iloc[-1]}%", 
-                                           className="text-center display-4"),
-                                    html.P(f"Target: 98%", className="card-text text-muted")
-                                ]
-                            )
-                        ],
-                        className="mb-4 text-center"
-                    ),
-                    width=3
-                ),
+                    [
+                        html.H3("Projects List", className="mt-4"),
+                        dash_table.DataTable(
+                            id="projects-table",
+                            columns=[{"name": col, "id": col} for col in PROJECT_LIST_COLUMNS],
+                            data=projects_df[PROJECT_LIST_COLUMNS].to_dict("records"),
+                            virtualization=True,
+                            fixed_rows={"headers": True},
+                            page_action="none",
+                            style_table={"height": "400px", "overflowY": "auto"},
+                            style_cell={"textAlign": "left"}
+                        )
+                    ],
+                    width=12
+                )
+            ]
+        )
+    ]
+
+def build_resources_tab(data, aggregates):
+    """Build the Resources tab content"""
+    resources_df = data["resources"]
+    type_counts = aggregates["resources_by_type"]
+    
+    # Per-department arrays for the utilization box plot and hours scatter
+    utilization = resources_df["utilization"].to_numpy(np.float32)
+    utilization_sizeref = 2.0 * utilization.max() / 20 ** 2  # plotly express' default size_max=20
+    available_hours = resources_df["available_hours"].to_numpy()
+    scheduled_hours = resources_df["scheduled_hours"].to_numpy()
+    resource_names = resources_df["name"].to_numpy()
+    departments = resources_df["department"].to_numpy()
+    department_masks = {
+        department: departments == department
+        for department in resources_df["department"].cat.categories
+    }
+    
+    return [
+        dbc.Row(
+            [
                 dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
+                    [
+                        html.H3("Resource Utilization by Department", className="mt-4"),
+                        static_graph(
+                            "resource_utilization",
+                            lambda: go.Figure(
                                 [
-                                    html.H4("Projects In Progress", className="card-title"),
-                                    html.H2(f"{len(projects_df[projects_df['progress'] < 100])}", 
-                                           className="text-center display-4"),
-                                    html.P(f"Completed: {len(projects_df[projects_df['progress'] == 100])}", 
-                                          className="card-text text-muted")
-                                ]
+                                    go.Box(y=utilization[mask], name=department)
+                                    for department, mask in department_masks.items()
+                                ],
+                                layout=go.Layout(
+                                    title="Resource Utilization Distribution",
+                                    xaxis_title="Department",
+                                    yaxis_title="Utilization (%)",
+                                    legend_title="Department"
+                                )
                             )
-                        ],
-                        className="mb-4 text-center"
-                    ),
-                    width=3
+                        )
+                    ],
+                    width=6
                 ),
                 dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                [
-                                    html.H4("Resource Utilization", className="card-title"),
-                                    html.H2(f"{resources_df['utilization'].mean():.1f}%", 
-                                           className="text-center display-4"),
-                                    html.P(f"Target: 85%", className="card-text text-muted")
-                                ]
+                    [
+                        html.H3("Resource Type Distribution", className="mt-4"),
+                        static_graph(
+                            "resources_by_type",
+                            lambda: go.Figure(
+                                go.Pie(
+                                    labels=type_counts.index.to_numpy(),
+                                    values=type_counts.to_numpy(),
+                                    marker_colors=qualitative.Plotly
+                                ),
+                                layout=go.Layout(title="Resources by Type")
                             )
-                        ],
-                        className="mb-4 text-center"
-                    ),
-                    width=3
+                        )
+                    ],
+                    width=6
                 )
-            ],
-            className="mb-4"
+            ]
         ),
-        
-        # Tabs for different views
-        dbc.Tabs(
+        dbc.Row(
             [
-                # Project Overview Tab
-                dbc.Tab(
+                dbc.Col(
                     [
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Project Status", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                projects_df.groupby("status").size().reset_index(name="count"),
-                                                x="status",
-                                                y="count",
-                                                color="status",
-                                                title="Projects by Status",
-                                                labels={"count": "Number of Projects", "status": "Status"},
-                                                color_discrete_sequence=px.colors.qualitative.G10
-                                            )
-                                        )
-                                    ],
-                                    width=6
-                                ),
-                                dbc.Col(
-                                    [
-                                        html.H3("Project Types", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.pie(
-                                                projects_df.groupby("type").size().reset_index(name="count"),
-                                                names="type",
-                                                values="count",
-                                                title="Projects by Type",
-                                                color_discrete_sequence=px.colors.qualitative.Plotly
-                                            )
-                                        )
-                                    ],
-                                    width=6
-                                )
-                            ]
-                        ),
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Project Schedule Performance", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.scatter(
-                                                projects_df,
-                                                x="cost_variance",
-                                                y="schedule_variance",
-                                                size="original_budget",
-                                                color="type",
-                                                hover_name="name",
-                                                title="Cost vs Schedule Variance",
-                                                labels={
-                                                    "cost_variance": "Cost Variance (%)",
-                                                    "schedule_variance": "Schedule Variance (%)"
-                                                }
-                                            )
-                                        )
-                                    ],
-                                    width=12
-                                )
-                            ]
-                        ),
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Projects List", className="mt-4"),
-                                        html.Div(
-                                            dbc.Table.from_dataframe(
-                                                projects_df[['name', 'customer', 'status', 'progress', 'due_date']],
-                                                striped=True,
-                                                bordered=True,
-                                                hover=True,
-                                                responsive=True
-                                            ),
-                                            style={"maxHeight": "400px", "overflow": "auto"}
-                                        )
-                                    ],
-                                    width=12
+                        html.H3("Resource Scheduled vs. Available Hours", className="mt-4"),
+                        static_graph(
+                            "resource_hours",
+                            lambda: go.Figure(
+                                [
+                                    go.Scattergl(
+                                        x=available_hours[mask],
+                                        y=scheduled_hours[mask],
+                                        mode="markers",
+                                        name=department,
+                                        text=resource_names[mask],
+                                        marker=dict(size=utilization[mask], sizemode="area", sizeref=utilization_sizeref)
+                                    )
+                                    for department, mask in department_masks.items()
+                                ],
+                                layout=go.Layout(
+                                    title="Available vs. Scheduled Hours",
+                                    xaxis_title="Available Hours",
+                                    yaxis_title="Scheduled Hours",
+                                    legend_title="Department"
                                 )
-                            ]
+                            )
                         )
                     ],
-                    label="Projects"
-                ),
-                
-                # Resources Tab
-                dbc.Tab(
+                    width=12
+                )
+            ]
+        )
+    ]
+
+def build_inventory_tab(data, aggregates):
+    """Build the Inventory tab content"""
+    inventory_df = data["inventory"]
+    components = inventory_df["component"].to_numpy()
+    inventory_by_lead_time = aggregates["inventory_by_lead_time"]
+    lead_times = inventory_by_lead_time["lead_time_days"].to_numpy()
+    
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
                     [
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Resource Utilization by Department", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.box(
-                                                resources_df,
-                                                x="department",
-                                                y="utilization",
-                                                color="department",
-                                                title="Resource Utilization Distribution",
-                                                labels={
-                                                    "department": "Department",
-                                                    "utilization": "Utilization (%)"
-                                                }
-                                            )
-                                        )
-                                    ],
-                                    width=6
-                                ),
-                                dbc.Col(
-                                    [
-                                        html.H3("Resource Type Distribution", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.pie(
-                                                resources_df.groupby("type").size().reset_index(name="count"),
-                                                names="type",
-                                                values="count",
-                                                title="Resources by Type",
-                                                color_discrete_sequence=px.colors.qualitative.Plotly
-                                            )
-                                        )
-                                    ],
-                                    width=6
-                                )
-                            ]
-                        ),
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Resource Scheduled vs. Available Hours", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.scatter(
-                                                resources_df,
-                                                x="available_hours",
-                                                y="scheduled_hours",
-                                                color="department",
-                                                size="utilization",
-                                                hover_name="name",
-                                                title="Available vs. Scheduled Hours",
-                                                labels={
-                                                    "available_hours": "Available Hours",
-                                                    "scheduled_hours": "Scheduled Hours"
-                                                }
-                                            )
-                                        )
-                                    ],
-                                    width=12
+                        html.H3("Component Inventory Levels", className="mt-4"),
+                        static_graph(
+                            "inventory_levels",
+                            lambda: go.Figure(
+                                [
+                                    go.Bar(x=components, y=inventory_df[status].to_numpy(), name=status)
+                                    for status in ("on_hand", "allocated", "on_order")
+                                ],
+                                layout=go.Layout(
+                                    title="Inventory Status by Component",
+                                    xaxis_title="Component",
+                                    yaxis_title="Quantity",
+                                    legend_title="Status",
+                                    barmode="group"
                                 )
-                            ]
+                            )
                         )
                     ],
-                    label="Resources"
-                ),
-                
-                # Inventory Tab
-                dbc.Tab(
+                    width=12
+                )
+            ]
+        ),
+        dbc.Row(
+            [
+                dbc.Col(
                     [
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Component Inventory Levels", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                inventory_df,
-                                                x="component",
-                                                y=["on_hand", "allocated", "on_order"],
-                                                title="Inventory Status by Component",
-                                                labels={
-                                                    "value": "Quantity",
-                                                    "component": "Component",
-                                                    "variable": "Status"
-                                                },
-                                                barmode="group"
-                                            )
-                                        )
-                                    ],
-                                    width=12
-                                )
-                            ]
-                        ),
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Inventory Lead Times", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                inventory_df.sort_values("lead_time_days", ascending=False),
-                                                x="component",
-                                                y="lead_time_days",
-                                                color="lead_time_days",
-                                                title="Component Lead Times",
-                                                labels={
-                                                    "lead_time_days": "Lead Time (Days)",
-                                                    "component": "Component"
-                                                },
-                                                color_continuous_scale=px.colors.sequential.Viridis
-                                            )
-                                        )
-                                    ],
-                                    width=6
+                        html.H3("Inventory Lead Times", className="mt-4"),
+                        static_graph(
+                            "inventory_lead_times",
+                            lambda: go.Figure(
+                                go.Bar(
+                                    x=inventory_by_lead_time["component"].to_numpy(),
+                                    y=lead_times,
+                                    marker=dict(
+                                        color=lead_times,
+                                        colorscale=sequential.Viridis,
+                                        colorbar=dict(title="Lead Time (Days)")
+                                    )
                                 ),
-                                dbc.Col(
-                                    [
-                                        html.H3("Inventory Value", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.pie(
-                                                inventory_df,
-                                                names="component",
-                                                values=inventory_df["on_hand"] * inventory_df["cost_per_unit"],
-                                                title="Inventory Value by Component",
-                                                hole=0.4,
-                                                labels={"value": "Value ($)"}
-                                            )
-                                        )
-                                    ],
-                                    width=6
+                                layout=go.Layout(
+                                    title="Component Lead Times",
+                                    xaxis_title="Component",
+                                    yaxis_title="Lead Time (Days)"
                                 )
-                            ]
+                            )
                         )
                     ],
-                    label="Inventory"
+                    width=6
                 ),
-                
-                # Performance KPIs Tab
-                dbc.Tab(
+                dbc.Col(
                     [
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Key Performance Indicators Over Time", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.line(
-                                                kpis_df,
-                                                x="date",
-                                                y=["on_time_delivery", "first_pass_yield", "labor_efficiency", "customer_satisfaction"],
-                                                title="KPIs Trend",
-                                                labels={
-                                                    "value": "Percentage",
-                                                    "date": "Month",
-                                                    "variable": "KPI"
-                                                }
-                                            )
-                                        )
-                                    ],
-                                    width=12
-                                )
-                            ]
-                        ),
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        html.H3("Quality Metrics", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.line(
-                                                kpis_df,
-                                                x="date",
-                                                y=["material_waste_percent", "cycle_time_variance", "engineering_change_orders"],
-                                                title="Quality Metrics Trend",
-                                                labels={
-                                                    "value": "Value",
-                                                    "date": "Month",
-                                                    "variable": "Metric"
-                                                }
-                                            )
-                                        )
-                                    ],
-                                    width=6
+                        html.H3("Inventory Value", className="mt-4"),
+                        static_graph(
+                            "inventory_value",
+                            lambda: go.Figure(
+                                go.Pie(
+                                    labels=components,
+                                    values=inventory_df["inventory_value"].to_numpy(),
+                                    hole=0.4,
+                                    hovertemplate="%{label}<br>Value ($)=%{value}<extra></extra>"
                                 ),
-                                dbc.Col(
-                                    [
-                                        html.H3("Safety Performance", className="mt-4"),
-                                        dcc.Graph(
-                                            figure=px.bar(
-                                                kpis_df,
-                                                x="date",
-                                                y="safety_incidents",
-                                                title="Safety Incidents by Month",
-                                                labels={
-                                                    "safety_incidents": "Number of Incidents",
-                                                    "date": "Month"
-                                                },
-                                                color_discrete_sequence=["#D62828"]
-                                            )
-                                        )
-                                    ],
-                                    width=6
+                                layout=go.Layout(title="Inventory Value by Component")
+                            )
+                        )
+                    ],
+                    width=6
+                )
+            ]
+        )
+    ]
+
+def build_kpis_tab(data, aggregates):
+    """Build the Performance KPIs tab content"""
+    kpis_df = data["kpis"]
+    dates = kpis_df["date"].dt.strftime("%Y-%m").to_numpy()
+    
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
+                    [
+                        html.H3("Key Performance Indicators Over Time", className="mt-4"),
+                        static_graph(
+                            "kpi_trend",
+                            lambda: go.Figure(
+                                [
+                                    go.Scattergl(x=dates, y=kpis_df[kpi].to_numpy(), mode="lines", name=kpi)
+                                    for kpi in ("on_time_delivery", "first_pass_yield", "labor_efficiency", "customer_satisfaction")
+                                ],
+                                layout=go.Layout(
+                                    title="KPIs Trend",
+                                    xaxis_title="Month",
+                                    yaxis_title="Percentage",
+                                    legend_title="KPI"
                                 )
-                            ]
+                            )
                         )
                     ],
-                    label="KPIs"
+                    width=12
                 )
             ]
         ),
-        
-        # Footer
         dbc.Row(
             [
                 dbc.Col(
-                    html.P(
-                        "ETO Manufacturing Dashboard for Food Packaging Robot Operations", 
-                        className="text-center text-muted my-4"
-                    ),
-                    width=12
+                    [
+                        html.H3("Quality Metrics", className="mt-4"),
+                        static_graph(
+                            "quality_metrics",
+                            lambda: go.Figure(
+                                [
+                                    go.Scattergl(x=dates, y=kpis_df[metric].to_numpy(), mode="lines", name=metric)
+                                    for metric in ("material_waste_percent", "cycle_time_variance", "engineering_change_orders")
+                                ],
+                                layout=go.Layout(
+                                    title="Quality Metrics Trend",
+                                    xaxis_title="Month",
+                                    yaxis_title="Value",
+                                    legend_title="Metric"
+                                )
+                            )
+                        )
+                    ],
+                    width=6
+                ),
+                dbc.Col(
+                    [
+                        html.H3("Safety Performance", className="mt-4"),
+                        static_graph(
+                            "safety_incidents",
+                            lambda: go.Figure(
+                                go.Bar(
+                                    x=dates,
+                                    y=kpis_df["safety_incidents"].to_numpy(),
+                                    marker_color=colors.danger
+                                ),
+                                layout=go.Layout(
+                                    title="Safety Incidents by Month",
+                                    xaxis_title="Month",
+                                    yaxis_title="Number of Incidents"
+                                )
+                            )
+                        )
+                    ],
+                    width=6
                 )
             ]
         )
-    ],
-    fluid=True,
-    style={"backgroundColor": colors["background"]}
-)
+    ]
+
+# Tab id -> (label, content builder), in display order
+TABS = {
+    "projects": ("Projects", build_projects_tab),
+    "resources": ("Resources", build_resources_tab),
+    "inventory": ("Inventory", build_inventory_tab),
+    "kpis": ("KPIs", build_kpis_tab)
+}
+
+DEFAULT_TAB = "projects"
+
+@lru_cache(maxsize=None)
+def render_tab(tab_id):
+    """Build a tab's content on first view and reuse it afterwards"""
+    _, builder = TABS[tab_id]
+    return builder(load_dashboard_data(), dashboard_aggregates())
+
+def serve_layout():
+    """Dashboard layout; non-default tab contents are filled in by the tab callback"""
+    return dbc.Container(
+        [
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.H1("ETO Manufacturing Dashboard", 
+                                className="text-center my-4",
+                                style={"color": colors.dark}),
+                        width=12
+                    )
+                ]
+            ),
+            
+            # KPI Summary Cards
+            summary_cards(),
+            
+            # Tabs for different views
+            dbc.Tabs(
+                [dbc.Tab(label=label, tab_id=tab_id) for tab_id, (label, _) in TABS.items()],
+                id="tabs",
+                active_tab=DEFAULT_TAB
+            ),
+            # The default tab ships with the layout; other tabs are built on first activation
+            html.Div(render_tab(DEFAULT_TAB), id="tab-content"),
+            
+            # Footer
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.P(
+                            "ETO Manufacturing Dashboard for Food Packaging Robot Operations", 
+                            className="text-center text-muted my-4"
+                        ),
+                        width=12
+                    )
+                ]
+            )
+        ],
+        fluid=True,
+        style={"backgroundColor": colors.background}
+    )
+
+# Dashboard layout. Dash would call serve_layout() on assignment to validate callback
+# ids; the skeleton below carries those ids so no data is loaded at import time.
+app.validation_layout = html.Div([dbc.Tabs(id="tabs"), html.Div(id="tab-content")])
+app.layout = serve_layout
+
+@callback(Output("tab-content", "children"), Input("tabs", "active_tab"), prevent_initial_call=True)
+def update_tab_content(active_tab):
+    """Render the content of the selected tab"""
+    return render_tab(active_tab)
 
 # Run the app
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=5000, debug=os.getenv("DASH_DEBUG") == "1")
@@ -12,35 +12,61 @@ import sys
 import json
 import csv
 import argparse
+import asyncio
 import datetime
 import logging
+import math
 import yaml
 import time
 import subprocess
-import re
+import shutil
+import shelve
+import sqlite3
+import traceback
+import tempfile
+import bisect
+import contextlib
+import functools
+import heapq
+import itertools
+import importlib.util
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Union
+from types import MappingProxyType, SimpleNamespace
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Import required libraries; GitPython and PyGithub are slow to import, so they are
+# only located here and imported by the code paths that actually use them
+git_available = importlib.util.find_spec("git") is not None
+github_available = importlib.util.find_spec("github") is not None
 
-# Import required libraries
 try:
-    import pandas as pd
-    pandas_available = True
+    import aiohttp
+    aiohttp_available = True
 except ImportError:
-    pandas_available = False
-    
+    aiohttp_available = False
+
 try:
-    import git
-    git_available = True
+    import orjson
+    orjson_available = True
 except ImportError:
-    git_available = False
-    
+    orjson_available = False
+
 try:
-    from github import Github, RateLimitExceededException, GithubException
-    from github.Repository import Repository
-    github_available = True
+    import ahocorasick
+    ahocorasick_available = True
 except ImportError:
-    github_available = False
+    ahocorasick_available = False
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Configure logging
 logging.basicConfig(
@@ -52,7 +78,85 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+GITHUB_API_URL = "https://api.github.com"
+SEARCH_PAGE_SIZE = 100
+
+# Config applied to every git we spawn: protocol v2 only advertises the refs a clone
+# asks for, and skipping hook templates and auto-gc saves post-clone work
+GIT_CONFIG = {
+    "protocol.version": "2",
+    "init.templateDir": "",
+    "gc.auto": "0",
+    "core.fsmonitor": "false",
+}
+GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_COUNT": str(len(GIT_CONFIG)),
+    **{f"GIT_CONFIG_KEY_{i}": key for i, key in enumerate(GIT_CONFIG)},
+    **{f"GIT_CONFIG_VALUE_{i}": value for i, value in enumerate(GIT_CONFIG.values())},
+    # Abort transfers stuck below 1 KB/s for a minute instead of hanging a clone slot
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "60",
+    # Never block on a credential prompt
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+# git's stdout is never read; only stderr is kept, for error messages
+GIT_RUN_KWARGS = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE, "env": GIT_ENV}
+
+# Sample repositories alternate between these languages
+SAMPLE_LANGUAGES = ("Python", "JavaScript")
+# Sample-data relevance and name prefix, picked by the first phrase found in the query
+SAMPLE_PROFILES = {
+    "food packaging": (0.8, "food-packaging"),
+    "automation": (0.7, "automation"),
+    "operations management": (0.9, "operations-mgmt"),
+    "replit": (0.7, "replit"),
+}
+
+# Rate-limited search requests are retried this many times before giving up
+SEARCH_MAX_RETRIES = 5
+SEARCH_THROTTLE_BELOW = 10  # Remaining search calls at which requests start being spaced out
+
+# Exports are written in 1 MiB chunks rather than the default 8 KiB
+EXPORT_BUFFER_SIZE = 1 << 20
+
+@functools.lru_cache(maxsize=None)
+def _load_config_file(abs_path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse a config file once per (path, mtime), reusing the JSON sidecar while it is fresh"""
+    cache_path = f"{abs_path}.cache.json"
+
+    # Parsed config is cached next to the YAML and keyed by its mtime
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if cached.pop("__mtime_ns", None) == mtime_ns:
+            return MappingProxyType(cached)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    with open(abs_path, 'rb') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+
+    if not isinstance(config, dict):
+        return config
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(abs_path), suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            json.dump({**config, "__mtime_ns": mtime_ns}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        # Values JSON can't represent (e.g. YAML dates) just mean no sidecar
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+    # Read-only view so callers can't mutate the shared cached dict
+    return MappingProxyType(config)
+
+
+@dataclass(slots=True)
 class RepoData:
     """Data class for repository information"""
     name: str
@@ -70,6 +174,135 @@ class RepoData:
     industry_relevance: float = 0.0
     cloned: bool = False
     clone_path: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain field dict; every field is a scalar, so asdict()'s recursive copy isn't needed"""
+        return dict(zip(REPO_FIELDS, repo_row(self)))
+
+
+REPO_FIELDS = tuple(f.name for f in fields(RepoData))
+repo_row = attrgetter(*REPO_FIELDS)
+
+_json_loads = orjson.loads if orjson_available else json.loads
+
+# One JSON document per repo, so exports can be streamed record by record
+if orjson_available:
+    def _dump_repo(repo: RepoData) -> bytes:
+        return orjson.dumps(repo, option=orjson.OPT_INDENT_2)
+else:
+    def _dump_repo(repo: RepoData) -> bytes:
+        return json.dumps(repo.to_dict(), indent=2).encode()
+
+
+class SearchRateLimiter:
+    """Shared pause for concurrent search requests, driven by GitHub's rate-limit headers"""
+    
+    def __init__(self):
+        self.resume_at = 0.0
+        self.interval = 0.0
+    
+    async def wait(self):
+        """Sleep until this request's slot, reserving the next one for the caller after it"""
+        now = time.time()
+        slot = max(self.resume_at, now)
+        self.resume_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def update(self, headers):
+        """Pace requests from the quota left in the current window"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        remaining = int(remaining)
+        reset = float(headers.get("X-RateLimit-Reset", time.time() + 60))
+        if remaining == 0:
+            self.resume_at = max(self.resume_at, reset + 1)  # Add buffer
+            self.interval = 0.0
+        elif remaining < SEARCH_THROTTLE_BELOW:
+            # Spread the last few calls over what is left of the window instead of stalling on the final one
+            self.interval = max(0.0, reset - time.time()) / remaining
+        else:
+            self.interval = 0.0
+    
+    def back_off(self, headers, attempt: int) -> float:
+        """Pause after a rate-limited response and return the wait in seconds"""
+        if "Retry-After" in headers:
+            wait_seconds = float(headers["Retry-After"])
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            wait_seconds = float(headers.get("X-RateLimit-Reset", time.time() + 60)) - time.time() + 1
+        else:
+            # Secondary limit without a hint: GitHub asks for at least a minute, then exponential
+            wait_seconds = min(60 * 2 ** attempt, 900)
+        self.resume_at = max(self.resume_at, time.time() + wait_seconds)
+        return max(0.0, wait_seconds)
+
+
+# Results table mirrors RepoData field for field, keyed by owner/name
+_SQLITE_TYPES = {str: "TEXT", int: "INTEGER", float: "REAL", bool: "INTEGER"}
+RESULTS_TABLE_DDL = (
+    "CREATE TABLE IF NOT EXISTS repos ("
+    + ", ".join(f"{f.name} {_SQLITE_TYPES[f.type]}" for f in fields(RepoData))
+    + ", PRIMARY KEY (owner, name))"
+)
+RESULTS_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO repos ({', '.join(REPO_FIELDS)}) "
+    f"VALUES ({', '.join('?' * len(REPO_FIELDS))})"
+)
+
+# pushed_at of each repository as of its last successful clone or update
+CLONE_STATE_DDL = (
+    "CREATE TABLE IF NOT EXISTS clones (owner TEXT, name TEXT, pushed_at TEXT, PRIMARY KEY (owner, name))"
+)
+CLONE_STATE_UPSERT_SQL = "INSERT OR REPLACE INTO clones (owner, name, pushed_at) VALUES (?, ?, ?)"
+
+
+# Defaults for every config key the cloner reads, per section
+CONFIG_DEFAULTS = {
+    "search": {
+        "query": "",
+        "industry_keywords": [],
+        "add_industry_keywords": True,
+        "min_stars": 10,
+        "languages": [],
+        "max_results": 100,
+        "date_range": "",
+        "min_industry_relevance": 0.0,
+        "etag_cache": ".github_etag_cache",
+        "cache_ttl": 3600,
+    },
+    "clone": {
+        "directory": "cloned_repos",
+        "max_repositories": 10,
+        "sort_by": "stars",
+        "shallow": True,
+        "depth": 1,
+        "single_branch": True,
+        "partial_clone": True,
+        "sparse_checkout": [],
+        "concurrent": True,
+        "max_concurrent": None,
+    },
+    "export": {
+        "json_file": None,
+        "csv_file": None,
+        "database": "github_results.db",
+    },
+}
+
+
+def run_timestamp() -> str:
+    """UTC timestamp for output filenames, taken once per run"""
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _config_namespace(config: Mapping[str, Any]) -> SimpleNamespace:
+    """Attribute view of the config, with defaults filled in so lookups need no .get() chains"""
+    sections = {
+        name: SimpleNamespace(**{**defaults, **(config.get(name) or {})})
+        for name, defaults in CONFIG_DEFAULTS.items()
+    }
+    return SimpleNamespace(github_token=config.get("github_token") or "", **sections)
 
 
 class GitHubAutoCloner:
@@ -78,14 +311,26 @@ class GitHubAutoCloner:
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize the GitHub Auto Cloner with configuration"""
         self.config = self._load_config(config_path)
-        self.github = self._init_github_client()
+        self.cfg = _config_namespace(self.config)
+        # Distinct lowercase keywords, so a keyword listed twice isn't weighted twice by the NumPy
+        # scorer (the automaton keeps one pattern per keyword anyway)
+        self._kw_lower = tuple(dict.fromkeys(kw.lower() for kw in self.cfg.search.industry_keywords))
+        self._kw_automaton = self._build_keyword_automaton(self._kw_lower)
+        # Quoted keyword terms appended to every search query; empty when not configured
+        search_config = self.cfg.search
+        self._kw_query_terms = (
+            tuple(f'"{kw}"' for kw in search_config.industry_keywords)
+            if search_config.add_industry_keywords else ()
+        )
+        self._relevance_cache = functools.lru_cache(maxsize=4096)(self._score_relevance)
         self.results = []
+        self._default_branches = {}
         
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+    def _load_config(self, config_path: str) -> Mapping[str, Any]:
         """Load configuration from YAML file"""
+        abs_path = os.path.abspath(config_path)
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _load_config_file(abs_path, os.stat(abs_path).st_mtime_ns)
             logger.info(f"Configuration loaded from {config_path}")
             return config
         except FileNotFoundError:
@@ -95,9 +340,14 @@ class GitHubAutoCloner:
             logger.error(f"Error parsing YAML configuration: {e}")
             sys.exit(1)
     
+    @functools.cached_property
+    def github(self):
+        """PyGithub client, created on first use so REST-only and --from-db runs skip it"""
+        return self._init_github_client()
+    
     def _init_github_client(self):
         """Initialize GitHub client with token from environment or config"""
-        token = os.getenv("GITHUB_TOKEN", self.config.get("github_token", ""))
+        token = os.getenv("GITHUB_TOKEN", self.cfg.github_token)
         if not token:
             logger.warning("GitHub token not found. Limited functionality available.")
             logger.warning("Set GITHUB_TOKEN environment variable for full functionality.")
@@ -105,6 +355,7 @@ class GitHubAutoCloner:
             
         if github_available:
             try:
+                from github import Github
                 github_client = Github(token)
                 # Test connection by getting the authenticated user
                 user = github_client.get_user().login
@@ -129,57 +380,72 @@ class GitHubAutoCloner:
         Returns:
             List of RepoData objects representing matching repositories
         """
-        search_config = self.config.get("search", {})
+        search_config = self.cfg.search
         
-        # Build the search query
+        # Build the search query from its parts and join once
         if query is None:
-            query = search_config.get("query", "")
+            query = search_config.query
+        parts = [query] if query else []
             
         # Add industry-relevant keywords if configured
-        if "industry_keywords" in search_config and search_config.get("add_industry_keywords", True):
-            industry_keywords = " ".join([f'"{kw}"' for kw in search_config["industry_keywords"]])
-            query = f"{query} {industry_keywords}" if query else industry_keywords
+        parts.extend(self._kw_query_terms)
             
         # Add minimum stars filter
-        min_stars = kwargs.get("min_stars", search_config.get("min_stars", 10))
-        query = f"{query} stars:>={min_stars}"
+        min_stars = kwargs.get("min_stars", search_config.min_stars)
+        parts.append(f"stars:>={min_stars}")
         
         # Add language filter if specified
-        languages = kwargs.get("languages", search_config.get("languages", []))
+        languages = kwargs.get("languages", search_config.languages)
         if languages:
-            lang_filter = " ".join([f'language:"{lang}"' for lang in languages])
-            query = f"{query} {lang_filter}"
+            parts.extend(f'language:"{lang}"' for lang in languages)
+        query = " ".join(parts)
             
         logger.info(f"Searching repositories with query: {query}")
         
-        # Use GitHub API if available
-        if github_available and self.github:
+        max_results = kwargs.get("max_results", search_config.max_results)
+        min_relevance = kwargs.get("min_relevance", search_config.min_industry_relevance)
+        token = os.getenv("GITHUB_TOKEN", self.cfg.github_token)
+        
+        # Prefer concurrent REST search when aiohttp is installed
+        if aiohttp_available and token:
             try:
-                # Get result count
-                total_count = self.github.search_repositories(query).totalCount
+                total_count, items = asyncio.run(self._search_rest(query, max_results, token))
                 logger.info(f"Found {total_count} repositories matching the search criteria")
                 
-                # Limit results
-                max_results = kwargs.get("max_results", search_config.get("max_results", 100))
-                if max_results < total_count:
-                    logger.info(f"Limiting results to {max_results} repositories")
-                    
+                repositories = [self._repo_from_item(item) for item in items]
+                repositories = self._score_and_filter(
+                    repositories, [item.get("topics", []) for item in items], min_relevance
+                )
+                self.results = repositories
+                self._store_results(repositories, replace=True)
+                return repositories
+                
+            except Exception as e:
+                logger.error(f"GitHub REST search failed: {str(e)}")
+                logger.warning("Falling back to PyGithub search")
+        
+        # Use GitHub API if available
+        if github_available and self.github:
+            try:
                 # Get the actual repositories
                 repositories = []
+                repo_topics = []
                 count = 0
+                total_count = None
                 
-                # Search GitHub
-                for repo in self.github.search_repositories(query, sort="stars", order="desc"):
+                # Search GitHub; the first page carries the total count, so no separate count query is needed
+                search_results = self.github.search_repositories(query, sort="stars", order="desc")
+                for repo in search_results:
+                    if total_count is None:
+                        total_count = search_results.totalCount
+                        logger.info(f"Found {total_count} repositories matching the search criteria")
+                        if max_results < total_count:
+                            logger.info(f"Limiting results to {max_results} repositories")
                     if count >= max_results:
                         break
                     
                     try:
-                        # Calculate industry relevance score
-                        industry_relevance = self._calculate_industry_relevance(
-                            repo.name, 
-                            repo.description or "", 
-                            repo.get_topics()
-                        )
+                        topics = repo.get_topics()
                         
                         # Create RepoData object
                         repo_data = RepoData(
@@ -195,10 +461,10 @@ class GitHubAutoCloner:
                             created_at=repo.created_at.isoformat() if repo.created_at else "",
                             updated_at=repo.updated_at.isoformat() if repo.updated_at else "",
                             pushed_at=repo.pushed_at.isoformat() if repo.pushed_at else "",
-                            industry_relevance=industry_relevance
                         )
                         
                         repositories.append(repo_data)
+                        repo_topics.append(topics)
                         count += 1
                         
                         # Check rate limit occasionally
@@ -208,13 +474,9 @@ class GitHubAutoCloner:
                     except Exception as e:
                         logger.error(f"Error processing repository {repo.full_name}: {str(e)}")
                 
-                # Filter by minimum industry relevance
-                min_relevance = kwargs.get("min_relevance", search_config.get("min_industry_relevance", 0.0))
-                if min_relevance > 0:
-                    repositories = [r for r in repositories if r.industry_relevance >= min_relevance]
-                    logger.info(f"Filtered to {len(repositories)} repositories with industry relevance >= {min_relevance}")
-                
+                repositories = self._score_and_filter(repositories, repo_topics, min_relevance)
                 self.results = repositories
+                self._store_results(repositories, replace=True)
                 return repositories
                 
             except Exception as e:
@@ -227,50 +489,160 @@ class GitHubAutoCloner:
         sample_repos = []
         
         # Add some sample repositories based on the query
-        if "food packaging" in query.lower():
-            relevance = 0.8
-            prefix = "food-packaging"
-        elif "automation" in query.lower():
-            relevance = 0.7
-            prefix = "automation"
-        elif "operations management" in query.lower():
-            relevance = 0.9
-            prefix = "operations-mgmt" 
-        elif "replit" in query.lower():
-            relevance = 0.7
-            prefix = "replit"
+        query_lower = query.lower()
+        for needle, (relevance, prefix) in SAMPLE_PROFILES.items():
+            if needle in query_lower:
+                break
         else:
-            relevance = 0.5
-            prefix = "sample"
+            relevance, prefix = 0.5, "sample"
             
         # Create a few sample repositories
-        for i in range(1, min(kwargs.get("max_results", search_config.get("max_results", 5)), 10) + 1):
+        now = datetime.datetime.now()
+        now_iso = now.isoformat()
+        description = f"This is a sample repository about {query} for demonstration purposes."
+        for i in range(1, min(kwargs.get("max_results", search_config.max_results), 10) + 1):
+            name = f"{prefix}-repo-{i}"
+            owner = f"example-user-{i}"
+            url = f"https://github.com/{owner}/{name}"
             repo_data = RepoData(
-                name=f"{prefix}-repo-{i}",
-                owner=f"example-user-{i}",
-                url=f"https://github.com/example-user-{i}/{prefix}-repo-{i}",
-                clone_url=f"https://github.com/example-user-{i}/{prefix}-repo-{i}.git",
-                description=f"This is a sample repository about {query} for demonstration purposes.",
+                name=name,
+                owner=owner,
+                url=url,
+                clone_url=f"{url}.git",
+                description=description,
                 stars=min_stars + i * 10,
                 forks=i * 5,
                 watchers=i * 3,
-                language="Python" if i % 2 == 0 else "JavaScript",
-                created_at=datetime.datetime.now().replace(month=i, day=i).isoformat(),
-                updated_at=datetime.datetime.now().isoformat(),
-                pushed_at=datetime.datetime.now().isoformat(),
+                language=SAMPLE_LANGUAGES[i % 2],
+                created_at=now.replace(month=i, day=i).isoformat(),
+                updated_at=now_iso,
+                pushed_at=now_iso,
                 industry_relevance=relevance - (i * 0.05)
             )
             sample_repos.append(repo_data)
             
         # Filter by minimum relevance
-        min_relevance = kwargs.get("min_relevance", search_config.get("min_industry_relevance", 0.0))
+        min_relevance = kwargs.get("min_relevance", search_config.min_industry_relevance)
         if min_relevance > 0:
             sample_repos = [r for r in sample_repos if r.industry_relevance >= min_relevance]
             
         self.results = sample_repos
+        # Stored like real results, so --from-db and later clone runs see this search only
+        self._store_results(sample_repos, replace=True)
         logger.info(f"Generated {len(sample_repos)} sample repositories")
         
         return sample_repos
+    def _score_and_filter(self, repositories: List[RepoData], repo_topics: List[List[str]],
+                          min_relevance: float) -> List[RepoData]:
+        """Score industry relevance for the whole batch at once and drop repos below min_relevance"""
+        scores = self.score_batch(
+            [r.name for r in repositories],
+            [r.description for r in repositories],
+            repo_topics
+        )
+        for repo_data, score in zip(repositories, scores.tolist()):
+            repo_data.industry_relevance = score
+        
+        if min_relevance > 0:
+            repositories = [r for r in repositories if r.industry_relevance >= min_relevance]
+            logger.info(f"Filtered to {len(repositories)} repositories with industry relevance >= {min_relevance}")
+        return repositories
+    
+    async def _search_rest(self, query: str, max_results: int, token: str):
+        """
+        Search the GitHub REST API, fetching result pages concurrently
+        
+        Args:
+            query: Full search query string
+            max_results: Maximum number of repositories to return
+            token: GitHub token used for authentication
+            
+        Returns:
+            Tuple of (total_count, list of repository items)
+        """
+        # The search API only ever serves the first 1000 results
+        pages = math.ceil(min(max_results, 1000) / SEARCH_PAGE_SIZE)
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        etag_path = self.cfg.search.etag_cache
+        semaphore = asyncio.Semaphore(10)
+        limiter = SearchRateLimiter()
+        connector = aiohttp.TCPConnector(limit_per_host=10)
+        
+        with shelve.open(etag_path) as etags:
+            async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+                # Page 1 tells us how many pages are actually worth fetching
+                first = await self._fetch_search_page(session, etags, semaphore, limiter, query, 1)
+                total_count = first.get("total_count", 0)
+                pages = min(pages, math.ceil(total_count / SEARCH_PAGE_SIZE))
+                rest = await asyncio.gather(
+                    *(self._fetch_search_page(session, etags, semaphore, limiter, query, page)
+                      for page in range(2, pages + 1))
+                )
+        
+        items = [item for page in (first, *rest) for item in page.get("items", [])]
+        return total_count, items[:max_results]
+    
+    async def _fetch_search_page(self, session, etags, semaphore, limiter, query: str, page: int) -> Dict[str, Any]:
+        """Fetch one search page, serving a fresh cached copy or revalidating it with If-None-Match"""
+        params = {"q": query, "sort": "stars", "order": "desc", "per_page": SEARCH_PAGE_SIZE, "page": page}
+        cache_key = f"{query}\x00{page}"
+        cached = etags.get(cache_key)
+        
+        # Pages fetched within the TTL are reused without touching the network
+        if cached and len(cached) > 2 and time.time() - cached[2] < self.cfg.search.cache_ttl:
+            return cached[1]
+        
+        async with semaphore:
+            for attempt in range(SEARCH_MAX_RETRIES + 1):
+                await limiter.wait()
+                request_headers = {"If-None-Match": cached[0]} if cached else {}
+                async with session.get(f"{GITHUB_API_URL}/search/repositories",
+                                       params=params, headers=request_headers) as resp:
+                    limiter.update(resp.headers)
+                    
+                    # Unchanged results don't count against the rate limit
+                    if resp.status == 304:
+                        etags[cache_key] = (cached[0], cached[1], time.time())
+                        return cached[1]
+                    
+                    if resp.status in (403, 429) and attempt < SEARCH_MAX_RETRIES and (
+                        resp.status == 429
+                        or resp.headers.get("X-RateLimit-Remaining") == "0"
+                        or "Retry-After" in resp.headers
+                        or "rate limit" in (await resp.text()).lower()
+                    ):
+                        wait_seconds = limiter.back_off(resp.headers, attempt)
+                        logger.warning(f"GitHub API rate limit hit, waiting {wait_seconds:.0f} seconds")
+                        continue
+                    
+                    resp.raise_for_status()
+                    payload = _json_loads(await resp.read())
+                    if "ETag" in resp.headers:
+                        etags[cache_key] = (resp.headers["ETag"], payload, time.time())
+                    return payload
+    
+    @staticmethod
+    def _repo_from_item(item: Dict[str, Any]) -> RepoData:
+        """Build a RepoData from a REST search result item"""
+        return RepoData(
+            name=item["name"],
+            owner=item["owner"]["login"],
+            url=item["html_url"],
+            clone_url=item["clone_url"],
+            description=item.get("description") or "",
+            stars=item.get("stargazers_count", 0),
+            forks=item.get("forks_count", 0),
+            watchers=item.get("watchers_count", 0),
+            language=item.get("language") or "Not specified",
+            created_at=item.get("created_at") or "",
+            updated_at=item.get("updated_at") or "",
+            pushed_at=item.get("pushed_at") or "",
+        )
+    
     def _calculate_industry_relevance(self, name: str, description: str, topics: List[str] = None) -> float:
         """
         Calculate industry relevance score for a repository based on available data
@@ -283,34 +655,101 @@ class GitHubAutoCloner:
         Returns:
             A relevance score between 0.0 and 1.0
         """
+        if not self._kw_lower:
+            return 1.0  # No industry filtering if no keywords specified
+        if self._kw_automaton is None:
+            return float(self.score_batch([name], [description], [topics])[0])
+        
+        # Repeat repos across pages and searches hit the per-instance cache
+        return self._relevance_cache(name, description or "", tuple(topics or ()))
+    
+    def _score_relevance(self, name: str, description: str, topics: tuple) -> float:
+        """Uncached relevance scoring behind _calculate_industry_relevance (needs the keyword automaton)"""
+        # Lowercase each text once; weights are per distinct keyword found. Fields go
+        # highest weight first (topics, description, name) so the 1.0 cap is hit early
+        topics_l = [topic.lower() for topic in topics]
+        texts = [*topics_l, (description or "").lower(), name.lower()]
+        weights = [0.5] * len(topics_l) + [0.3, 0.2]
         relevance_score = 0.0
-        industry_keywords = self.config.get("search", {}).get("industry_keywords", [])
         
-        if not industry_keywords:
-            return 1.0  # No industry filtering if no keywords specified
+        # One automaton pass over all fields joined by a separator no keyword contains;
+        # each match's end offset maps back to the field it fell in
+        field_ends = list(itertools.accumulate(len(text) + 1 for text in texts))
+        seen = set()
+        for end, keyword in self._kw_automaton.iter("\x01".join(texts)):
+            hit = (bisect.bisect_right(field_ends, end), keyword)
+            if hit not in seen:
+                seen.add(hit)
+                relevance_score += weights[hit[0]]
+                if relevance_score >= 1.0:
+                    return 1.0
+        
+        return relevance_score
+    
+    def score_batch(self, names: List[str], descriptions: List[str],
+                    topics_list: List[List[str]]) -> "np.ndarray":
+        """
+        _calculate_industry_relevance over many repositories
         
-        # Check repository description
-        description = description or ""
-        for keyword in industry_keywords:
-            if keyword.lower() in description.lower():
-                relevance_score += 0.3
+        With pyahocorasick installed each repository gets one automaton pass (cached
+        across pages and searches); otherwise keywords are matched column-wise in NumPy.
         
-        # Check repository topics
-        if topics:
-            for topic in topics:
-                for keyword in industry_keywords:
-                    if keyword.lower() in topic.lower():
-                        relevance_score += 0.5
+        Args:
+            names: Repository names
+            descriptions: Repository descriptions (parallel to names)
+            topics_list: Topics for each repository (parallel to names)
+            
+        Returns:
+            Array of relevance scores between 0.0 and 1.0
+        """
+        import numpy as np
+        
+        n = len(names)
+        if not self._kw_lower:
+            return np.ones(n)
+        if n == 0:
+            return np.zeros(0)
+        
+        if self._kw_automaton is not None:
+            return np.fromiter(
+                map(self._calculate_industry_relevance, names, descriptions, topics_list),
+                dtype=float, count=n
+            )
+        
+        names_l = np.strings.lower(np.array(names, dtype=str))
+        descriptions_l = np.strings.lower(np.array([d or "" for d in descriptions], dtype=str))
+        
+        # Topics are ragged, so flatten them and remember which repo each came from
+        topic_owner = np.repeat(np.arange(n), [len(t or ()) for t in topics_list])
+        topics_l = np.strings.lower(np.array([t for ts in topics_list for t in ts or ()], dtype=str))
         
-        # Check repository name
-        for keyword in industry_keywords:
-            if keyword.lower() in name.lower():
-                relevance_score += 0.2
+        # Count keyword hits per row, one vectorized pass per keyword
+        desc_hits = np.zeros(n)
+        name_hits = np.zeros(n)
+        topic_hits = np.zeros(len(topics_l))
+        for keyword in self._kw_lower:
+            desc_hits += np.strings.find(descriptions_l, keyword) >= 0
+            name_hits += np.strings.find(names_l, keyword) >= 0
+            if len(topics_l):
+                topic_hits += np.strings.find(topics_l, keyword) >= 0
         
-        # Cap at 1.0
-        return min(relevance_score, 1.0)
+        scores = 0.3 * desc_hits + 0.2 * name_hits
+        scores += 0.5 * np.bincount(topic_owner, weights=topic_hits, minlength=n)
+        return np.minimum(scores, 1.0)
     
-    def clone_repositories(self, repositories=None, clone_dir=None, max_to_clone=None):
+    @staticmethod
+    def _build_keyword_automaton(keywords):
+        """Build an Aho-Corasick automaton over the keywords, if pyahocorasick is installed"""
+        if not ahocorasick_available or not keywords:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def clone_repositories(self, repositories=None, clone_dir=None, max_to_clone=None,
+                           max_concurrent=None, concurrent=None):
         """
         Clone selected repositories to the local filesystem
         
@@ -318,6 +757,8 @@ class GitHubAutoCloner:
             repositories: List of repositories to clone (uses self.results if None)
             clone_dir: Directory where repositories should be cloned (overrides config)
             max_to_clone: Maximum number of repositories to clone (overrides config)
+            max_concurrent: Maximum number of clones running at once (overrides config)
+            concurrent: Clone through parallel git subprocesses (overrides config)
             
         Returns:
             List of cloned repository data
@@ -330,12 +771,12 @@ class GitHubAutoCloner:
             return []
         
         # Get configuration
-        clone_config = self.config.get("clone", {})
+        clone_config = self.cfg.clone
         if clone_dir is None:
-            clone_dir = clone_config.get("directory", "cloned_repos")
+            clone_dir = clone_config.directory
         
         if max_to_clone is None:
-            max_to_clone = clone_config.get("max_repositories", 10)
+            max_to_clone = clone_config.max_repositories
             
         # Create clone directory if it doesn't exist
         clone_path = Path(clone_dir)
@@ -343,96 +784,326 @@ class GitHubAutoCloner:
         
         logger.info(f"Cloning up to {max_to_clone} repositories to {clone_path}")
         
-        # Sort repositories by stars or industry relevance
-        sort_by = clone_config.get("sort_by", "stars")
+        # Pick the top repositories by stars or industry relevance without sorting the whole list
+        sort_by = clone_config.sort_by
         if sort_by == "industry_relevance":
-            repositories = sorted(repositories, key=lambda r: r.industry_relevance, reverse=True)
+            sort_key = attrgetter("industry_relevance")
         else:  # Default to sorting by stars
-            repositories = sorted(repositories, key=lambda r: r.stars, reverse=True)
-        
-        # Limit number of repositories to clone
-        to_clone = repositories[:max_to_clone]
-        cloned_repos = []
+            sort_key = attrgetter("stars")
+        # Paged searches can return the same repository twice; keep one entry per owner/name
+        unique = {(repo.owner, repo.name): repo for repo in repositories}
+        to_clone = heapq.nlargest(max_to_clone, unique.values(), key=sort_key)
         
         # Get GitHub token for authentication if available
-        token = os.getenv("GITHUB_TOKEN", self.config.get("github_token", ""))
+        token = os.getenv("GITHUB_TOKEN", self.cfg.github_token)
         
+        # One directory listing instead of per-repository exists() probes
+        existing = self._scan_clone_dir(clone_path, {f"{repo.owner}_{repo.name}" for repo in to_clone})
+        
+        # Checkouts whose remote hasn't been pushed to since they were last synced need no fetch
+        synced = self._load_clone_state()
+        unchanged, pending = [], []
         for repo in to_clone:
-            target_dir = clone_path / f"{repo.owner}_{repo.name}"
+            if (repo.pushed_at and existing.get(f"{repo.owner}_{repo.name}")
+                    and synced.get((repo.owner, repo.name)) == repo.pushed_at):
+                repo.cloned = True
+                repo.clone_path = str(clone_path / f"{repo.owner}_{repo.name}")
+                unchanged.append(repo)
+            else:
+                pending.append(repo)
+        if unchanged:
+            logger.info(f"Skipping {len(unchanged)} repositories unchanged since their last sync")
+        
+        started = time.perf_counter()
+        if concurrent is None:
+            concurrent = clone_config.concurrent
+        if concurrent:
+            if max_concurrent is None:
+                max_concurrent = clone_config.max_concurrent or max(1, min(32, (os.cpu_count() or 1) * 2))
+            logger.info(f"Running up to {max_concurrent} clones concurrently")
+            cloned_repos = asyncio.run(
+                self._clone_concurrently(pending, clone_path, token, max_concurrent, existing)
+            )
+        else:
+            cloned_repos = []
+            for repo in pending:
+                target_dir = clone_path / f"{repo.owner}_{repo.name}"
+                # None if absent, otherwise whether the directory holds a git repo
+                is_git_repo = existing.get(target_dir.name)
             
-            try:
-                # Create authenticated URL if token is available
-                clone_url = repo.clone_url
-                if token and "github.com" in clone_url:
-                    # Insert token into clone URL for authentication
-                    clone_url = clone_url.replace("https://", f"https://{token}@")
+                try:
+                    # Create authenticated URL if token is available
+                    clone_url = repo.clone_url
+                    if token and "github.com" in clone_url:
+                        # Insert token into clone URL for authentication
+                        clone_url = clone_url.replace("https://", f"https://{token}@")
                 
-                logger.info(f"Cloning {repo.url} to {target_dir}")
+                    logger.debug(f"Cloning {repo.url} to {target_dir}")
                 
-                if git_available:
-                    # Use GitPython if available
-                    try:
-                        if target_dir.exists() and (target_dir / ".git").exists():
-                            git_repo = git.Repo(target_dir)
-                            git_repo.remotes.origin.pull()
-                            logger.info(f"Updated existing repository {repo.name}")
-                        else:
-                            if target_dir.exists():
-                                import shutil
-                                shutil.rmtree(target_dir)
-                            git.Repo.clone_from(clone_url, target_dir)
-                            logger.info(f"Cloned new repository {repo.name}")
+                    if git_available:
+                        # Use GitPython if available
+                        import git
+                        try:
+                            if is_git_repo:
+                                git_repo = git.Repo(target_dir)
+                                if self.cfg.clone.shallow:
+                                    # Fetch only the new tip so the clone stays shallow
+                                    git_repo.git.fetch(f"--depth={self.cfg.clone.depth}", "origin", "HEAD")
+                                    git_repo.git.reset("--hard", "FETCH_HEAD")
+                                else:
+                                    git_repo.remotes.origin.pull()
+                                logger.debug(f"Updated existing repository {repo.name}")
+                            else:
+                                if is_git_repo is not None:
+                                    shutil.rmtree(target_dir)
+                                git_repo = git.Repo.clone_from(clone_url, target_dir, env=GIT_ENV, multi_options=self._clone_options())
+                                if self._sparse_patterns():
+                                    git_repo.git.sparse_checkout("set", "--no-cone", *self._sparse_patterns())
+                                logger.debug(f"Cloned new repository {repo.name}")
                         
-                        repo.cloned = True
-                        repo.clone_path = str(target_dir)
-                        cloned_repos.append(repo)
-                    except Exception as e:
-                        logger.error(f"GitPython error while cloning {repo.name}: {str(e)}")
-                        raise
-                else:
-                    # Fall back to subprocess git commands
-                    if target_dir.exists():
-                        if (target_dir / ".git").exists():
-                            # If it's a git repo, update it
-                            cmd = ["git", "-C", str(target_dir), "pull", "origin", "main"]
-                            result = subprocess.run(cmd, capture_output=True, text=True)
-                            if result.returncode != 0:
-                                # Try master branch if main fails
-                                cmd = ["git", "-C", str(target_dir), "pull", "origin", "master"]
-                                result = subprocess.run(cmd, capture_output=True, text=True)
-                        else:
-                            # If directory exists but isn't a git repo, remove and clone
-                            import shutil
-                            shutil.rmtree(target_dir)
-                            cmd = ["git", "clone", clone_url, str(target_dir)]
-                            result = subprocess.run(cmd, capture_output=True, text=True)
+                            repo.cloned = True
+                            repo.clone_path = str(target_dir)
+                            cloned_repos.append(repo)
+                        except Exception as e:
+                            logger.error(f"GitPython error while cloning {repo.name}: {str(e)}")
+                            raise
                     else:
-                        # Clone new repository
-                        cmd = ["git", "clone", clone_url, str(target_dir)]
-                        result = subprocess.run(cmd, capture_output=True, text=True)
+                        # Fall back to subprocess git commands
+                        fresh_clone = not is_git_repo
+                        if is_git_repo is not None:
+                            if is_git_repo and self.cfg.clone.shallow:
+                                # Fetch only the new tip so the clone stays shallow
+                                cmd = ["git", "-C", str(target_dir), "fetch", "--quiet", f"--depth={self.cfg.clone.depth}", "origin", "HEAD"]
+                                result = subprocess.run(cmd, **GIT_RUN_KWARGS)
+                                if result.returncode == 0:
+                                    cmd = ["git", "-C", str(target_dir), "reset", "--quiet", "--hard", "FETCH_HEAD"]
+                                    result = subprocess.run(cmd, **GIT_RUN_KWARGS)
+                            elif is_git_repo:
+                                # If it's a git repo, update its default branch
+                                cmd = ["git", "-C", str(target_dir), *self._pull_args(target_dir)]
+                                result = subprocess.run(cmd, **GIT_RUN_KWARGS)
+                            else:
+                                # If directory exists but isn't a git repo, remove and clone
+                                shutil.rmtree(target_dir)
+                                cmd = ["git", "clone", *self._clone_options(), clone_url, str(target_dir)]
+                                result = subprocess.run(cmd, **GIT_RUN_KWARGS)
+                        else:
+                            # Clone new repository
+                            cmd = ["git", "clone", *self._clone_options(), clone_url, str(target_dir)]
+                            result = subprocess.run(cmd, **GIT_RUN_KWARGS)
+                        
+                        if result.returncode == 0 and fresh_clone and self._sparse_patterns():
+                            cmd = ["git", "-C", str(target_dir), "sparse-checkout", "set", "--no-cone", *self._sparse_patterns()]
+                            result = subprocess.run(cmd, **GIT_RUN_KWARGS)
                     
-                    if result.returncode == 0:
-                        repo.cloned = True
-                        repo.clone_path = str(target_dir)
-                        cloned_repos.append(repo)
-                        logger.info(f"Successfully cloned/updated {repo.name}")
-                    else:
-                        error_message = result.stderr
-                        # Don't log the full error if it might contain the token
-                        if token and token in error_message:
-                            error_message = error_message.replace(token, "[REDACTED]")
-                        logger.error(f"Failed to clone {repo.name}: {error_message}")
+                        if result.returncode == 0:
+                            repo.cloned = True
+                            repo.clone_path = str(target_dir)
+                            cloned_repos.append(repo)
+                            logger.debug(f"Successfully cloned/updated {repo.name}")
+                        else:
+                            error_message = result.stderr.decode("utf-8", "replace")
+                            # Don't log the full error if it might contain the token
+                            if token and token in error_message:
+                                error_message = error_message.replace(token, "[REDACTED]")
+                            logger.error(f"Failed to clone {repo.name}: {error_message}")
                         
-            except Exception as e:
-                error_message = str(e)
-                # Don't log the full error if it might contain the token
-                if token and token in error_message:
-                    error_message = error_message.replace(token, "[REDACTED]")
-                logger.error(f"Error while cloning {repo.url}: {error_message}")
+                except Exception as e:
+                    error_message = str(e)
+                    # Don't log the full error if it might contain the token
+                    if token and token in error_message:
+                        error_message = error_message.replace(token, "[REDACTED]")
+                    logger.error(f"Error while cloning {repo.url}: {error_message}")
         
-        logger.info(f"Successfully cloned {len(cloned_repos)} repositories")
+        elapsed = time.perf_counter() - started
+        logger.info(f"Successfully cloned {len(cloned_repos)}/{len(pending)} repositories in {elapsed:.1f}s")
+        self._store_clone_state(cloned_repos)
+        cloned_repos = unchanged + cloned_repos
+        self._store_results(cloned_repos)
         return cloned_repos
     
+    def _clone_options(self) -> List[str]:
+        """Extra `git clone` flags; shallow, blobless, single-branch clones unless disabled"""
+        clone_config = self.cfg.clone
+        options = ["--quiet"]
+        if clone_config.shallow:
+            options.append(f"--depth={clone_config.depth}")
+        if clone_config.single_branch:
+            options.append("--single-branch")
+        if clone_config.partial_clone:
+            # Servers without filter support just ignore it with a warning
+            options.append("--filter=blob:none")
+        if self._sparse_patterns():
+            options.append("--sparse")
+        return options
+    
+    def _pull_args(self, target_dir: Path) -> List[str]:
+        """`git pull` arguments for the remote's default branch of an existing clone"""
+        key = str(target_dir)
+        if key not in self._default_branches:
+            result = subprocess.run(
+                ["git", "-C", key, "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
+                capture_output=True, text=True
+            )
+            # origin/HEAD is missing on some clones; plain `git pull` then uses the upstream
+            branch = result.stdout.strip().removeprefix("origin/") if result.returncode == 0 else ""
+            self._default_branches[key] = branch
+        
+        branch = self._default_branches[key]
+        return ["pull", "--quiet", "origin", branch] if branch else ["pull", "--quiet"]
+    
+    def _sparse_patterns(self) -> List[str]:
+        """Path patterns to keep in the work tree after cloning (empty for a full checkout)"""
+        return list(self.cfg.clone.sparse_checkout)
+    
+    @staticmethod
+    def _scan_clone_dir(clone_path: Path, names) -> Dict[str, bool]:
+        """Map each of names present in the clone directory to whether it is a git checkout"""
+        with os.scandir(clone_path) as entries:
+            present = {entry.name: entry for entry in entries if entry.name in names}
+        # Only the targets pay for a .git probe, however many other checkouts the directory holds
+        return {
+            name: entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git"))
+            for name, entry in present.items()
+        }
+    
+    async def _clone_concurrently(self, repositories, clone_path, token, max_concurrent, existing):
+        """Clone or update repositories in parallel git subprocesses"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        results = await asyncio.gather(
+            *(self._clone_one_async(repo, clone_path, token, semaphore, existing) for repo in repositories)
+        )
+        return [repo for repo, cloned in zip(repositories, results) if cloned]
+    
+    async def _clone_one_async(self, repo, clone_path, token, semaphore, existing) -> bool:
+        """Clone or update a single repository with the git CLI"""
+        target_dir = clone_path / f"{repo.owner}_{repo.name}"
+        is_git_repo = existing.get(target_dir.name)
+        
+        # Create authenticated URL if token is available
+        clone_url = repo.clone_url
+        if token and "github.com" in clone_url:
+            clone_url = clone_url.replace("https://", f"https://{token}@")
+        
+        async with semaphore:
+            logger.debug(f"Cloning {repo.url} to {target_dir}")
+            try:
+                if is_git_repo and self.cfg.clone.shallow:
+                    # Fetch only the new tip so the clone stays shallow
+                    returncode, stderr = await self._run_git(
+                        "-C", str(target_dir), "fetch", "--quiet", f"--depth={self.cfg.clone.depth}", "origin", "HEAD"
+                    )
+                    if returncode == 0:
+                        returncode, stderr = await self._run_git("-C", str(target_dir), "reset", "--quiet", "--hard", "FETCH_HEAD")
+                elif is_git_repo:
+                    # If it's a git repo, update its default branch
+                    pull_args = await asyncio.to_thread(self._pull_args, target_dir)
+                    returncode, stderr = await self._run_git("-C", str(target_dir), *pull_args)
+                else:
+                    if is_git_repo is not None:
+                        # If directory exists but isn't a git repo, remove and clone
+                        await asyncio.to_thread(shutil.rmtree, target_dir)
+                    returncode, stderr = await self._run_git("clone", *self._clone_options(), clone_url, str(target_dir))
+                    if returncode == 0 and self._sparse_patterns():
+                        returncode, stderr = await self._run_git(
+                            "-C", str(target_dir), "sparse-checkout", "set", "--no-cone", *self._sparse_patterns()
+                        )
+            except Exception as e:
+                returncode, stderr = -1, str(e)
+        
+        if returncode == 0:
+            repo.cloned = True
+            repo.clone_path = str(target_dir)
+            logger.debug(f"Successfully cloned/updated {repo.name}")
+            return True
+        
+        # Don't log the full error if it might contain the token
+        if token and token in stderr:
+            stderr = stderr.replace(token, "[REDACTED]")
+        logger.error(f"Failed to clone {repo.name}: {stderr.strip()}")
+        return False
+    
+    @staticmethod
+    async def _run_git(*args):
+        """Run a git command without blocking the event loop, returning (returncode, stderr)"""
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=GIT_ENV
+        )
+        _, stderr = await proc.communicate()
+        return proc.returncode, stderr.decode(errors="replace")
+    
+    def _store_results(self, repositories: List[RepoData], replace: bool = False):
+        """
+        Upsert repositories into the results database in a single transaction
+        
+        Args:
+            repositories: Repositories to store
+            replace: Drop the rows of earlier searches first, so the table holds this search only
+        """
+        database = self.cfg.export.database
+        if not database or not (repositories or replace):
+            return
+        try:
+            with contextlib.closing(sqlite3.connect(database)) as con:
+                with con:
+                    con.execute(RESULTS_TABLE_DDL)
+                    if replace:
+                        con.execute("DELETE FROM repos")
+                    con.executemany(RESULTS_UPSERT_SQL, map(repo_row, repositories))
+            logger.debug(f"Stored {len(repositories)} repositories in {database}")
+        except sqlite3.Error as e:
+            logger.error(f"Error storing results in {database}: {str(e)}")
+    
+    def _load_clone_state(self) -> Dict[tuple, str]:
+        """Map (owner, name) to the pushed_at recorded at each repository's last sync"""
+        database = self.cfg.export.database
+        if not database or not os.path.exists(database):
+            return {}
+        try:
+            with contextlib.closing(sqlite3.connect(database)) as con:
+                con.execute(CLONE_STATE_DDL)
+                return {(owner, name): pushed_at
+                        for owner, name, pushed_at in con.execute("SELECT owner, name, pushed_at FROM clones")}
+        except sqlite3.Error as e:
+            logger.error(f"Error loading clone state from {database}: {str(e)}")
+            return {}
+    
+    def _store_clone_state(self, repositories: List[RepoData]):
+        """Record the pushed_at each repository was synced at"""
+        database = self.cfg.export.database
+        if not database or not repositories:
+            return
+        try:
+            with contextlib.closing(sqlite3.connect(database)) as con:
+                with con:
+                    con.execute(CLONE_STATE_DDL)
+                    con.executemany(CLONE_STATE_UPSERT_SQL,
+                                    ((repo.owner, repo.name, repo.pushed_at) for repo in repositories))
+        except sqlite3.Error as e:
+            logger.error(f"Error storing clone state in {database}: {str(e)}")
+    
+    def load_results(self) -> List[RepoData]:
+        """Load the repositories stored by the last search, most starred first"""
+        database = self.cfg.export.database
+        if not database or not os.path.exists(database):
+            logger.warning("No stored results to load")
+            return []
+        try:
+            with contextlib.closing(sqlite3.connect(database)) as con:
+                rows = con.execute(f"SELECT {', '.join(REPO_FIELDS)} FROM repos ORDER BY stars DESC").fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading results from {database}: {str(e)}")
+            return []
+        
+        self.results = [RepoData(*row) for row in rows]
+        for repo in self.results:
+            repo.cloned = bool(repo.cloned)
+        logger.info(f"Loaded {len(self.results)} repositories from {database}")
+        return self.results
+    
     def _check_rate_limit(self):
         """Check GitHub API rate limit and pause if necessary"""
         if not github_available or not self.github:
@@ -456,13 +1127,14 @@ class GitHubAutoCloner:
         except Exception as e:
             logger.error(f"Error checking rate limit: {str(e)}")
             
-    def export_results(self, format: str = "json", output_file: str = None) -> str:
+    def export_results(self, format: str = "json", output_file: str = None, run_ts: str = None) -> str:
         """
         Export search results to JSON or CSV file
         
         Args:
             format: Output format ('json' or 'csv')
             output_file: Output filename (overrides config)
+            run_ts: Timestamp used in default filenames (defaults to the current UTC time)
             
         Returns:
             Path to the output file
@@ -471,38 +1143,29 @@ class GitHubAutoCloner:
             logger.warning("No results to export")
             return ""
         
-        export_config = self.config.get("export", {})
+        export_config = self.cfg.export
         
         if output_file is None:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            if run_ts is None:
+                run_ts = run_timestamp()
             if format.lower() == "csv":
-                output_file = export_config.get("csv_file", f"github_results_{timestamp}.csv")
+                output_file = export_config.csv_file or f"github_results_{run_ts}.csv"
             else:
-                output_file = export_config.get("json_file", f"github_results_{timestamp}.json")
+                output_file = export_config.json_file or f"github_results_{run_ts}.json"
         
         try:
-            # Convert results to dictionaries
-            results_dict = [asdict(repo) for repo in self.results]
-            
             if format.lower() == "csv":
-                if pandas_available:
-                    # Use pandas for CSV export if available
-                    try:
-                        df = pd.DataFrame(results_dict)
-                        df.to_csv(output_file, index=False, quoting=csv.QUOTE_NONNUMERIC)
-                        logger.info("Exported results using pandas")
-                    except Exception as e:
-                        logger.error(f"Error using pandas for export: {str(e)}")
-                        logger.warning("Falling back to basic CSV export")
-                        self._export_csv_basic(results_dict, output_file)
-                else:
-                    # Basic CSV export without pandas
-                    logger.info("Pandas not available, using basic CSV export")
-                    self._export_csv_basic(results_dict, output_file)
+                if not self._export_csv(self.results, output_file):
+                    return ""
             else:
-                # JSON export
-                with open(output_file, 'w') as f:
-                    json.dump(results_dict, f, indent=2)
+                # JSON export, streamed one repo at a time
+                with open(output_file, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(b"[\n")
+                    for i, repo in enumerate(self.results):
+                        if i:
+                            f.write(b",\n")
+                        f.write(_dump_repo(repo))
+                    f.write(b"\n]\n")
             
             logger.info(f"Exported {len(self.results)} results to {output_file}")
             return output_file
@@ -511,23 +1174,22 @@ class GitHubAutoCloner:
             logger.error(f"Error exporting results: {str(e)}")
             return ""
             
-    def _export_csv_basic(self, results_dict, output_file):
-        """Helper method for basic CSV export without pandas"""
+    def _export_csv(self, results, output_file):
+        """Helper method for CSV export, streamed row by row"""
         try:
-            with open(output_file, 'w', newline='') as f:
-                if results_dict:
-                    writer = csv.DictWriter(f, fieldnames=results_dict[0].keys(), 
-                                          quoting=csv.QUOTE_NONNUMERIC)
-                    writer.writeheader()
-                    writer.writerows(results_dict)
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                if results:
+                    writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
+                    writer.writerow(REPO_FIELDS)
+                    writer.writerows(map(repo_row, results))
             return True
         except Exception as e:
-            logger.error(f"Error in basic CSV export: {str(e)}")
+            logger.error(f"Error in CSV export: {str(e)}")
             return False
 
 
-def main():
-    """Main entry point for the CLI application"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
         description="GitHub Auto Cloner - Find, filter, and clone relevant GitHub repositories"
     )
@@ -584,6 +1246,18 @@ def main():
         help="Maximum number of repositories to clone (overrides config file)"
     )
     
+    parser.add_argument(
+        "--max-concurrent-clone",
+        type=int,
+        help="Maximum number of repositories cloned in parallel (overrides config file)"
+    )
+    
+    parser.add_argument(
+        "--no-concurrent",
+        action="store_true",
+        help="Clone repositories one at a time"
+    )
+    
     parser.add_argument(
         "--export-format",
         choices=["json", "csv"],
@@ -596,6 +1270,12 @@ def main():
         help="Output filename for export (overrides config file)"
     )
     
+    parser.add_argument(
+        "--from-db",
+        action="store_true",
+        help="Use the results stored by a previous run instead of searching again"
+    )
+    
     parser.add_argument(
         "--search-only",
         action="store_true",
@@ -608,16 +1288,20 @@ def main():
         help="Enable verbose logging"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for the CLI application"""
+    args = _build_parser().parse_args()
+    run_ts = run_timestamp()
     
     # Set logging level based on verbosity
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
-    # Print header
-    print("\n" + "="*80)
-    print(" GitHub Auto Cloner ".center(80, "="))
-    print("="*80)
+    # Print header in one buffered write
+    sys.stdout.write("\n".join(["", "="*80, " GitHub Auto Cloner ".center(80, "="), "="*80, ""]))
     
     try:
         # Initialize auto cloner with config
@@ -636,28 +1320,35 @@ def main():
         if args.languages:
             search_kwargs["languages"] = args.languages
         
-        # Print search criteria
-        print("\n📋 Search Criteria:")
-        print(f"  Query: {args.query or cloner.config.get('search', {}).get('query', 'Not specified')}")
-        print(f"  Min Stars: {args.min_stars or cloner.config.get('search', {}).get('min_stars', 'Not specified')}")
-        if args.languages or cloner.config.get('search', {}).get('languages'):
-            print(f"  Languages: {args.languages or cloner.config.get('search', {}).get('languages', [])}")
-        print()
+        # Print search criteria as one block
+        lines = [
+            "\n📋 Search Criteria:",
+            f"  Query: {args.query or cloner.cfg.search.query or 'Not specified'}",
+            f"  Min Stars: {args.min_stars or cloner.cfg.search.min_stars}",
+        ]
+        if args.languages or cloner.cfg.search.languages:
+            lines.append(f"  Languages: {args.languages or cloner.cfg.search.languages}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
             
-        # Perform search
-        print("🔍 Searching repositories...")
-        repositories = cloner.search_repositories(args.query, **search_kwargs)
+        # Perform search, or pick up the results stored by an earlier run
+        if args.from_db:
+            print("📂 Loading stored results...")
+            repositories = cloner.load_results()
+        else:
+            print("🔍 Searching repositories...")
+            repositories = cloner.search_repositories(args.query, **search_kwargs)
         
         if repositories:
-            print(f"\n✅ Found {len(repositories)} repositories matching criteria:")
-            for i, repo in enumerate(repositories[:5], 1):
-                print(f"  {i}. {repo.name} by {repo.owner} ({repo.stars} ⭐) - Relevance: {repo.industry_relevance:.2f}")
+            lines = [f"\n✅ Found {len(repositories)} repositories matching criteria:"]
+            lines.extend(
+                f"  {i}. {repo.name} by {repo.owner} ({repo.stars} ⭐) - Relevance: {repo.industry_relevance:.2f}"
+                for i, repo in enumerate(repositories[:5], 1)
+            )
             if len(repositories) > 5:
-                print(f"  ... and {len(repositories)-5} more")
-            print()
+                lines.append(f"  ... and {len(repositories)-5} more")
+            sys.stdout.write("\n".join(lines) + "\n\n")
         else:
-            print("\n❌ No repositories found matching the criteria")
-            print("  Try adjusting your search parameters or query.")
+            print("\n❌ No repositories found matching the criteria\n  Try adjusting your search parameters or query.")
             sys.exit(0)
         
         # Clone repositories if not in search-only mode
@@ -666,11 +1357,13 @@ def main():
             cloned = cloner.clone_repositories(
                 repositories=repositories,
                 clone_dir=args.clone_dir,
-                max_to_clone=args.max_clone
+                max_to_clone=args.max_clone,
+                max_concurrent=args.max_concurrent_clone,
+                concurrent=False if args.no_concurrent else None
             )
             
             if cloned:
-                print(f"\n✅ Successfully cloned {len(cloned)} repositories to {args.clone_dir or cloner.config.get('clone', {}).get('directory', 'cloned_repos')}")
+                print(f"\n✅ Successfully cloned {len(cloned)} repositories to {args.clone_dir or cloner.cfg.clone.directory}")
             else:
                 print("\n⚠️ No repositories were cloned")
         
@@ -679,13 +1372,13 @@ def main():
             print("\n📊 Exporting results...")
             output_file = cloner.export_results(
                 format=args.export_format,
-                output_file=args.output_file
+                output_file=args.output_file,
+                run_ts=run_ts
             )
             if output_file:
                 print(f"✅ Results exported to {output_file}")
             
-        print("\n✅ Operation completed successfully!")
-        print("="*80 + "\n")
+        print("\n✅ Operation completed successfully!\n" + "="*80 + "\n")
         
     except KeyboardInterrupt:
         print("\n\n⚠️ Operation interrupted by user")
@@ -693,7 +1386,6 @@ def main():
     except Exception as e:
         print(f"\n\n❌ Error: {str(e)}")
         if args.verbose:
-            import traceback
             print(traceback.format_exc())
         sys.exit(1)
 